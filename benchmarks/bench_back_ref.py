@@ -0,0 +1,68 @@
+"""
+Benchmark - GC pause time and peak memory of parent/child graphs with and without `back_ref`
+
+Run with: python benchmarks/bench_back_ref.py [parents] [children]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from cyclic_classes import back_ref, register
+
+
+@register
+class Parent:
+    def __init__(self, children: int, child_cls: type):
+        self.children = [child_cls(self) for _ in range(children)]
+
+
+@register
+class StrongChild:
+    def __init__(self, parent: Parent):
+        self.parent = parent
+
+
+@register
+class WeakChild:
+    parent = back_ref(Parent)
+
+    def __init__(self, parent: Parent):
+        self.parent = parent
+
+
+def run(child_cls: type, parents: int, children: int) -> tuple[float, int, int, float]:
+    """Build the graph, drop it and measure how much work is left for the cyclic GC"""
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        graph = [Parent(children, child_cls) for _ in range(parents)]
+        build = time.perf_counter() - start
+        del graph
+
+        start = time.perf_counter()
+        collected = gc.collect()
+        pause = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    return pause, collected, peak, build
+
+
+def main():
+    parents = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    children = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    print(f"{parents} parents x {children} children")
+    print(f"{'variant':<10} {'build [ms]':>12} {'gc pause [ms]':>14} {'collected':>10} {'peak [MiB]':>11}")
+    for label, child_cls in (("strong", StrongChild), ("back_ref", WeakChild)):
+        pause, collected, peak, build = run(child_cls, parents, children)
+        print(f"{label:<10} {build * 1e3:>12.2f} {pause * 1e3:>14.2f} {collected:>10} {peak / 2**20:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark - call overhead of registered functions imported through `cyclic_imports` compared with a direct call
+
+Run with: python benchmarks/bench_functions.py [number]
+"""
+
+import sys
+import types
+import timeit
+
+from cyclic_classes import register
+from cyclic_classes.classes import track_import, get_registered_class
+
+
+def make(value: int) -> int:
+    return value
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    # Simulate `cyclic_imports` of `make` into a module before its registration
+    name = __name__ + ".make"
+    importer = types.ModuleType("importer")
+    placeholder = get_registered_class(name=name, qualname="make")
+    importer.make = placeholder
+    track_import(obj=placeholder, namespace=importer, asname="make")
+
+    register(make)
+
+    cases = {
+        "direct": make,
+        "rebound": importer.make,  # Name imported by `cyclic_imports`, rebound on registration
+        "placeholder": placeholder,  # Placeholder kept by reference, forwards the call
+    }
+    baseline = None
+    print(f"{'variant':<12} {'ns/call':>10} {'overhead':>10}")
+    for label, func in cases.items():
+        elapsed = min(timeit.repeat(lambda f=func: f(1), number=number, repeat=5)) / number * 1e9
+        baseline = baseline or elapsed
+        print(f"{label:<12} {elapsed:>10.1f} {elapsed / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark - repeated subscripting of a registered generic class and get_origin/get_args round-trips
+
+Run with: python benchmarks/bench_generics.py [number]
+"""
+
+import sys
+import timeit
+from typing import Generic, TypeVar, get_args, get_origin
+
+from cyclic_classes import register
+from cyclic_classes.classes import get_registered_class
+
+T = TypeVar("T")
+
+# Placeholder as retrieved by `cyclic_imports` before the registration
+Placeholder = get_registered_class(name=__name__ + ".Repo", qualname="Repo")
+
+
+@register
+class Repo(Generic[T]):
+    pass
+
+
+class Pod:
+    pass
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    cases = {
+        "subscript direct": lambda: Repo[Pod],
+        "subscript placeholder": lambda: Placeholder[Pod],
+        "round-trip direct": lambda: get_origin(Repo[Pod])[get_args(Repo[Pod])],
+        "round-trip placeholder": lambda: get_origin(Placeholder[Pod])[get_args(Placeholder[Pod])],
+    }
+    print(f"{'variant':<24} {'ns/op':>10}")
+    for label, func in cases.items():
+        elapsed = min(timeit.repeat(func, number=number, repeat=5)) / number * 1e9
+        print(f"{label:<24} {elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,9 @@ Cyclic Classes - __init__
 import logging
 
 from .context import CyclicClassesImports as cyclic_imports
-from .decorators import register
+from .scheduler import prewarm
+from .decorators import register, register_value
+from .descriptors import BackReference as back_ref
 
 logger = logging.getLogger(__name__)
 
@@ -7,6 +7,7 @@ from __future__ import annotations
 import types
 import inspect
 import logging
+import threading
 from abc import ABC, ABCMeta
 from typing import Callable
 
@@ -17,6 +18,10 @@ from .exceptions import CyclicRegisteredClassError
 
 logger = logging.getLogger(__name__)
 
+# Guards placeholder/module creation and registration bookkeeping - modules can be imported from multiple threads
+# (e.g. by `prewarm` in the background while the main thread does its own `cyclic_imports`)
+_lock = threading.RLock()
+
 
 class _PostInitCaller(ABCMeta):
     """Enable post_init on a newly created class"""
@@ -40,6 +45,8 @@ class _RegisteredClassM(_PostInitCaller):
     """
 
     __refs__: dict[Callable] = {}
+    __objects__: dict[type, object] = {}  # Placeholders of registered functions and values
+    __imports__: dict[type, list[tuple[object, str]]] = {}  # Namespaces the placeholders were imported into
 
     def __new__(mcs, name, bases, dct, **kwargs):  # pylint: disable=too-many-locals
         # Base registration classes provide the registered_class kwarg as True <- handled by @registerd decorator
@@ -66,13 +73,15 @@ class _RegisteredClassM(_PostInitCaller):
         filtered_bases = filter(lambda base: base.__module__ + "." + base.__qualname__ == expected_base_class, bases)
         cb = next(filtered_bases)
 
-        if clz := _RegisteredClassM.__refs__.get(cb, False):
-            raise CyclicRegisteredClassError(f"Class {cb} already is registered with: {clz}")
+        with _lock:
+            if clz := _RegisteredClassM.__refs__.get(cb, False):
+                raise CyclicRegisteredClassError(f"Class {cb} already is registered with: {clz}")
 
-        # Create a Registered class within cyclic_classes.registered module
-        reg_clz = super().__new__(mcs, name, bases, dct)
-        logger.debug(f"Registering class {cb} as {reg_clz}")
-        _RegisteredClassM.__refs__[cb] = reg_clz
+            # Create a Registered class within cyclic_classes.registered module
+            reg_clz = super().__new__(mcs, name, bases, dct)
+            logger.debug(f"Registering class {cb} as {reg_clz}")
+            _RegisteredClassM.__refs__[cb] = reg_clz
+            _RegisteredClassM.__imports__.pop(cb, None)  # Classes are not rebound, placeholders create them instead
 
         # Add references for static methods
         reg_clz_attrs = reg_clz.__dict__.copy()
@@ -108,6 +117,20 @@ class RegisteredClass(
                 f"Could not instantiate object of class {cls} with registered class {create}, reason: [{exc}]"
             ) from exc
 
+    def __class_getitem__(cls, params):
+        """
+        Subscript the registered (generic) class instead of the placeholder
+        """
+        create = _RegisteredClassM.__refs__.get(cls)
+        if create is None:
+            if not cls.__module__.startswith(REGISTERED_MODULE):
+                raise TypeError(f"type '{cls.__qualname__}' is not subscriptable")
+            # Not registered yet (e.g. annotation evaluated within a cyclic import) - alias the placeholder itself
+            return types.GenericAlias(cls, params)
+
+        # Parametrized aliases of generic classes are cached by typing itself already
+        return create[params]
+
 
 def _get_recursive(obj: object, name: str, qualname: str, obj_factory: Callable[[str], type]) -> type:
     """
@@ -126,15 +149,63 @@ def _get_recursive(obj: object, name: str, qualname: str, obj_factory: Callable[
         setattr(obj, name, new_obj)
         return _get_recursive(obj=new_obj, name=subname, qualname=qualname, obj_factory=obj_factory)
 
-    # `Name` is no longer splittable
-    if new_obj := getattr(obj, name, None):
-        return new_obj
+    # `Name` is no longer splittable (registered values can be falsy, hence hasattr)
+    if hasattr(obj, name):
+        return getattr(obj, name)
 
     new_obj = obj_factory(qualname)
     setattr(obj, name, new_obj)
     return new_obj
 
 
+def register_object(name: str, qualname: str, obj: object):
+    """
+    Register a non-class object (function or value)
+
+    Placeholder created for the `name` is replaced by the `obj` itself - both in the registered module tree and in all
+    namespaces it was already imported into by `cyclic_imports`, so that there's no indirection left. Placeholder kept
+    elsewhere by reference forwards the calls to the `obj`.
+    """
+    with _lock:
+        placeholder = get_registered_class(name=name, qualname=qualname)
+        if not isinstance(placeholder, _RegisteredClassM) or not placeholder.__module__.startswith(REGISTERED_MODULE):
+            raise CyclicRegisteredClassError(f"Object {name} already is registered with: {placeholder!r}")
+        if clz := _RegisteredClassM.__refs__.get(placeholder, False):
+            raise CyclicRegisteredClassError(f"Object {name} already is registered with: {clz}")
+
+        logger.debug(f"Registering object {name} as {obj!r}")
+        _RegisteredClassM.__objects__[placeholder] = obj
+        # Placeholder kept by reference somewhere forwards the calls - through its own metaclass, so that concrete
+        # registered classes are not affected, and with `obj` as the `__call__` itself (no intermediate frame)
+        placeholder.__class__ = type(
+            f"{type(placeholder).__name__}[{qualname}]", (type(placeholder),), {"__call__": staticmethod(obj)}
+        )
+
+        parent = get_registered_module(name=name[0 : -len(qualname)].rstrip(".") or None)
+        *outer, attr = qualname.split(".")
+        for outer_name in outer:
+            parent = getattr(parent, outer_name)
+        setattr(parent, attr, obj)
+
+        for namespace, asname in _RegisteredClassM.__imports__.pop(placeholder, []):
+            if getattr(namespace, asname, None) is placeholder:
+                logger.debug(f"Rebinding {asname} in {namespace} to {obj!r}")
+                setattr(namespace, asname, obj)
+
+
+def track_import(obj: object, namespace: object, asname: str):
+    """
+    Remember where a placeholder was imported to, so it can be rebound once its function or value gets registered
+    """
+    with _lock:
+        if not isinstance(obj, _RegisteredClassM) or obj in _RegisteredClassM.__refs__:
+            return
+        if obj in _RegisteredClassM.__objects__:  # Registered meanwhile by another thread
+            setattr(namespace, asname, _RegisteredClassM.__objects__[obj])
+            return
+        _RegisteredClassM.__imports__.setdefault(obj, []).append((namespace, asname))
+
+
 def get_registered_class(name: str, qualname: str):
     """
     Create a registered class
@@ -157,9 +228,10 @@ def get_registered_class(name: str, qualname: str):
     module_name = name[0 : -len(qualname)]
     if module_name.endswith("."):
         module_name = module_name[:-1]
-    module = get_registered_module(name=module_name if module_name else None)
 
-    clz = _get_recursive(obj=module, name=qualname, qualname=qualname, obj_factory=create_class)
+    with _lock:
+        module = get_registered_module(name=module_name if module_name else None)
+        clz = _get_recursive(obj=module, name=qualname, qualname=qualname, obj_factory=create_class)
     return clz
 
 
@@ -174,10 +246,11 @@ def get_registered_module(name: str):
     module = _registered
 
     if name:
-        for mod_name in name.split("."):
-            submodule = getattr(module, mod_name, None)
-            if submodule is None:
-                submodule = types.ModuleType(module.__name__ + "." + mod_name)
-                setattr(module, mod_name, submodule)
-            module = submodule
+        with _lock:
+            for mod_name in name.split("."):
+                submodule = getattr(module, mod_name, None)
+                if submodule is None:
+                    submodule = types.ModuleType(module.__name__ + "." + mod_name)
+                    setattr(module, mod_name, submodule)
+                module = submodule
     return module
@@ -13,7 +13,7 @@ import logging
 import importlib
 from inspect import currentframe, getframeinfo
 
-from .classes import get_registered_class, get_registered_module
+from .classes import track_import, get_registered_class, get_registered_module
 from .constants import ENCODING_CAPTURE
 from .exceptions import CyclicNonImportError
 
@@ -232,7 +232,9 @@ class CyclicClassesImports(_SkippableContext):
             new_mod = types.ModuleType(mod_name)
             setattr(old_mod, mod_name, new_mod)
             old_mod = new_mod
-        setattr(old_mod, asname.rsplit(".", maxsplit=1)[-1], rgz_obj)
+        attr = asname.rsplit(".", maxsplit=1)[-1]
+        setattr(old_mod, attr, rgz_obj)
+        track_import(obj=rgz_obj, namespace=old_mod, asname=attr)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         ret = super().__exit__(exc_type, exc_val, exc_tb)
@@ -4,15 +4,24 @@ Cyclic Classes - Decorators
 
 from __future__ import annotations
 
-from .classes import get_registered_class
+import sys
+
+from .classes import register_object, _RegisteredClassM, get_registered_class
+from .constants import REGISTERED_MODULE
+from .exceptions import CyclicRegisteredClassError
 
 
 def register(cls):
-    """Register a class with the cyclic_classes space"""
+    """Register a class (or a function) with the cyclic_classes space"""
+    if not isinstance(cls, type):
+        return _register_function(cls)
+
     # Get registered class which we'll register under
     registered_name = cls.__qualname__
     name = cls.__module__ + "." + registered_name
     registered = get_registered_class(name=name, qualname=registered_name)
+    if not isinstance(registered, _RegisteredClassM) or not registered.__module__.startswith(REGISTERED_MODULE):
+        raise CyclicRegisteredClassError(f"Class {name} already is registered with: {registered!r}")
 
     # Create a new class that will now be registered under the registered_class and return that instead
     new_cls = type(
@@ -26,3 +35,30 @@ def register(cls):
     )
     new_cls.__registered__ = cls
     return new_cls
+
+
+def _register_function(func):
+    """Register a function - function itself is returned, so calls within its own module are not affected at all"""
+    qualname = getattr(func, "__qualname__", None)
+    if not callable(func) or qualname is None:
+        raise CyclicRegisteredClassError(f"Only classes and functions can be registered, got {func!r}")
+    if "<locals>" in qualname:
+        raise CyclicRegisteredClassError(f"Cannot register local function {func.__module__}.{qualname}")
+
+    register_object(name=func.__module__ + "." + qualname, qualname=qualname, obj=func)
+    return func
+
+
+def register_value(name: str, value, module: str | None = None):
+    """
+    Register a module-level value (e.g. a constant) with the cyclic_classes space
+
+    Value is registered under the `name` within the `module` (calling module by default) and returned unchanged:
+    MAX_PODS = register_value("MAX_PODS", 10)
+    """
+    if "." in name:
+        raise CyclicRegisteredClassError(f"Value name cannot contain dots, got [{name}]")
+    if module is None:
+        module = sys._getframe(1).f_globals["__name__"]  # pylint: disable=protected-access
+    register_object(name=module + "." + name, qualname=name, obj=value)
+    return value
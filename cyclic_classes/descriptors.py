@@ -0,0 +1,69 @@
+"""
+Cyclic Classes - Descriptors
+"""
+
+from __future__ import annotations
+
+import weakref
+
+from .exceptions import CyclicBackRefError
+
+
+class BackReference:
+    """
+    Weakly referenced back-reference between objects of (registered) classes
+
+    Objects linked both ways through plain attributes (e.g. Deployment <-> Pod) form a reference cycle that only the
+    cyclic garbage collector is able to free. Storing the back-reference (child -> parent) through this descriptor
+    keeps the link weak, so the whole graph is freed by reference counting alone once the parent is dropped.
+
+    The optional `cls` can be a placeholder class retrieved from `cyclic_imports`, it is checked on assignment only.
+
+    Parent held only by its children is freed immediately, e.g. `Pod("x", deployment=Deployment("y"))` reads `None`
+    right away - keep a strong reference to the parent elsewhere. Instances need a `__dict__` (no `__slots__` only
+    classes) to store the reference in.
+    """
+
+    def __init__(self, cls: type | None = None):
+        self.cls = cls
+        self.name: str | None = None
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def _storage(self, obj: object) -> dict:
+        """
+        Instance dictionary the reference is stored in
+        """
+        try:
+            return obj.__dict__
+        except AttributeError as exc:
+            raise CyclicBackRefError(
+                f"Back-reference `{self.name}` requires instances of {type(obj)} to have a __dict__ (no __slots__)"
+            ) from exc
+
+    def __get__(self, obj: object, objtype: type | None = None):
+        if obj is None:
+            return self
+        ref = self._storage(obj).get(self.name)
+        return None if ref is None else ref()
+
+    def __set__(self, obj: object, value: object):
+        storage = self._storage(obj)
+        if value is None:
+            storage[self.name] = None
+            return
+        if self.cls is not None and not isinstance(value, self.cls):
+            raise CyclicBackRefError(f"Back-reference `{self.name}` expects {self.cls}, got {type(value)}")
+        try:
+            storage[self.name] = weakref.ref(value)
+        except TypeError as exc:
+            raise CyclicBackRefError(
+                f"Could not create back-reference `{self.name}` to {type(value)}, reason: [{exc}]"
+            ) from exc
+
+    def __delete__(self, obj: object):
+        try:
+            del self._storage(obj)[self.name]
+        except KeyError as exc:
+            raise AttributeError(self.name) from exc
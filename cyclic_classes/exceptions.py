@@ -13,3 +13,7 @@ class CyclicNonImportError(CyclicError):
 
 class CyclicRegisteredClassError(CyclicError):
     """RegisteredClass exception"""
+
+
+class CyclicBackRefError(CyclicError):
+    """BackReference exception"""
@@ -0,0 +1,204 @@
+"""
+Cyclic Classes - Scheduler
+"""
+
+from __future__ import annotations
+
+import ast
+import time
+import heapq
+import types
+import logging
+import importlib
+import threading
+from typing import Callable, Iterable
+from dataclasses import field, dataclass
+from concurrent.futures import Future, Executor
+
+from . import registered as _registered
+from .classes import _lock, _RegisteredClassM
+from .constants import REGISTERED_MODULE
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrewarmResult:
+    """Import of a single module"""
+
+    module: str
+    elapsed: float
+    error: Exception | None = None
+
+
+@dataclass
+class PrewarmReport:
+    """Summary of the whole prewarm run"""
+
+    results: list[PrewarmResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    unresolved: list[str] = field(default_factory=list)  # Placeholders that are still not registered afterwards
+
+
+def _unresolved(obj: object, path: str) -> Iterable[type]:
+    """
+    Walk the registered tree and yield placeholders whose classes were not registered yet
+    """
+    for name, value in list(vars(obj).items()):
+        if isinstance(value, types.ModuleType) and value.__name__ == path + "." + name:
+            yield from _unresolved(value, value.__name__)
+        elif isinstance(value, _RegisteredClassM) and value.__module__.startswith(REGISTERED_MODULE):
+            if value.__qualname__.rsplit(".", maxsplit=1)[-1] != name:
+                continue  # Attribute inherited or aliased, not a placeholder owned by this object
+            if value not in _RegisteredClassM.__refs__ and value not in _RegisteredClassM.__objects__:
+                yield value
+            yield from _unresolved(value, path)
+
+
+def _defining_module(placeholder: type) -> str:
+    """
+    Name of the module the placeholder's class is expected to be defined in
+    """
+    return placeholder.__module__[len(REGISTERED_MODULE) + 1 :]
+
+
+def unresolved_placeholders() -> list[str]:
+    """
+    Full names (module + qualname) of placeholders which still wait for their registration
+    """
+    with _lock:
+        placeholders = list(_unresolved(_registered, REGISTERED_MODULE))
+    return [_defining_module(placeholder) + "." + placeholder.__qualname__ for placeholder in placeholders]
+
+
+def _dependencies(module: str, modules: set[str]) -> set[str]:
+    """
+    Modules (out of `modules`) the `module` imports - parsed from its source, `cyclic_imports` clauses included
+    """
+    try:
+        spec = importlib.util.find_spec(module)
+        source = spec.loader.get_source(module) if spec and spec.loader else None
+        tree = ast.parse(source) if source else None
+    except (ImportError, ValueError, SyntaxError) as exc:
+        logger.debug(f"Could not parse module [{module}] for its dependencies, reason: [{exc}]")
+        return set()
+    if tree is None:
+        return set()
+
+    package = module if spec.submodule_search_locations else module.rpartition(".")[0]
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                base = importlib.util.resolve_name("." * node.level + (node.module or ""), package)
+            except ImportError:
+                continue
+            names.add(base)
+            names.update(base + "." + alias.name for alias in node.names)
+    # Absolute imports written as relative ones are resolved by `cyclic_imports` as well
+    names.update([package + "." + name for name in names if package])
+    return (names & modules) - {module}
+
+
+def _modules(priority: Iterable[str]) -> list[str]:
+    """
+    Defining modules of unresolved placeholders in dependency order
+
+    Module imported (directly or via `cyclic_imports`) by another module goes first. Ties (and cycles) are resolved by
+    `priority` first, then parent packages before submodules.
+    """
+    priority = list(priority)
+    with _lock:
+        placeholders = list(_unresolved(_registered, REGISTERED_MODULE))
+    modules = {_defining_module(placeholder) for placeholder in placeholders} - {"__main__"}
+
+    dependants: dict[str, set[str]] = {module: set() for module in modules}
+    pending = {module: 0 for module in modules}
+    for module in modules:
+        for dependency in _dependencies(module, modules):
+            dependants[dependency].add(module)
+            pending[module] += 1
+
+    def key(module: str) -> tuple[int, int, str]:
+        rank = next(
+            (i for i, prefix in enumerate(priority) if module == prefix or module.startswith(prefix + ".")),
+            len(priority),
+        )
+        return rank, module.count("."), module
+
+    ready = [key(module) for module, count in pending.items() if count == 0]
+    heapq.heapify(ready)
+    ordered = []
+    while pending:
+        # Cyclic dependencies - break the cycle with the module that would go first otherwise
+        module = heapq.heappop(ready)[-1] if ready else min(pending, key=key)
+        if module not in pending:
+            continue
+        del pending[module]
+        ordered.append(module)
+        for dependant in dependants[module]:
+            if dependant in pending:
+                pending[dependant] -= 1
+                if pending[dependant] == 0:
+                    heapq.heappush(ready, key(dependant))
+    return ordered
+
+
+def _prewarm(priority: Iterable[str], progress: Callable[[PrewarmResult, int, int], None] | None) -> PrewarmReport:
+    """
+    Import the modules one by one (parallel imports of cyclic modules could deadlock on import locks)
+    """
+    report = PrewarmReport()
+    start = time.perf_counter()
+    modules = _modules(priority=priority)  # Finding specs imports parent packages - keep it in the background too
+    logger.debug(f"Prewarming modules: {modules}")
+    for i, module in enumerate(modules, start=1):
+        module_start = time.perf_counter()
+        error = None
+        try:
+            importlib.import_module(module)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Could not prewarm module [{module}], reason: [{exc}]")
+            error = exc
+        result = PrewarmResult(module=module, elapsed=time.perf_counter() - module_start, error=error)
+        logger.debug(f"Prewarmed module [{module}] in {result.elapsed:.6f}s ({i}/{len(modules)})")
+
+        report.results.append(result)
+        if progress is not None:
+            progress(result, i, len(modules))
+    report.elapsed = time.perf_counter() - start
+    report.unresolved = unresolved_placeholders()
+    return report
+
+
+def prewarm(
+    executor: Executor | None = None,
+    priority: Iterable[str] = (),
+    progress: Callable[[PrewarmResult, int, int], None] | None = None,
+) -> Future[PrewarmReport]:
+    """
+    Import defining modules of unresolved placeholders in the background
+
+    Modules are imported within the `executor` (or a daemon thread if not provided) in dependency order, modules
+    matching `priority` names go first among the independent ones. `progress` is called after each module with its
+    result, number of modules done and total. Returned future resolves to a PrewarmReport - from asyncio use
+    `await asyncio.wrap_future(prewarm())` to not block the event loop.
+    """
+    priority = list(priority)
+    if executor is not None:
+        return executor.submit(_prewarm, priority, progress)
+
+    future: Future[PrewarmReport] = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(_prewarm(priority, progress))
+        except BaseException as exc:  # pylint: disable=broad-exception-caught
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="cyclic-classes-prewarm", daemon=True).start()
+    return future
@@ -0,0 +1,2 @@
+# pylint:disable=missing-docstring,too-few-public-methods
+from .api import Api
@@ -0,0 +1,17 @@
+# pylint:disable=missing-docstring,too-few-public-methods
+from cyclic_classes import register, cyclic_imports
+
+with cyclic_imports():
+    # pylint:disable=cyclic-import
+    from .models.team import Team
+    from .models.user import User
+
+
+@register
+class Api:
+
+    def user(self, name: str):
+        return User(name)
+
+    def team(self, *names: str):
+        return Team(*names)
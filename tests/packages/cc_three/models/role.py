@@ -0,0 +1,7 @@
+# pylint:disable=missing-docstring,too-few-public-methods
+from cyclic_classes import register
+
+
+@register
+class Role:
+    pass
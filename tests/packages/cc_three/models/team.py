@@ -0,0 +1,13 @@
+# pylint:disable=missing-docstring,too-few-public-methods
+from cyclic_classes import register, cyclic_imports
+
+with cyclic_imports():
+    # pylint:disable=cyclic-import
+    from .user import User
+
+
+@register
+class Team:
+
+    def __init__(self, *names: str):
+        self.users = [User(name) for name in names]
@@ -0,0 +1,9 @@
+# pylint:disable=missing-docstring,too-few-public-methods
+from cyclic_classes import register
+
+
+@register
+class User:
+
+    def __init__(self, name: str):
+        self.name = name
@@ -0,0 +1,5 @@
+# pylint:disable=missing-docstring,too-few-public-methods
+# Deployment is imported first, so that `pod` placeholders are created before their registration
+from .deployment import Deployment  # isort:skip
+from .pod import Pod
+from .repo import Repo
@@ -0,0 +1,27 @@
+# pylint:disable=missing-docstring,too-few-public-methods
+from cyclic_classes import register, cyclic_imports
+
+with cyclic_imports():
+    # pylint:disable=cyclic-import
+    from .pod import POD_PORT, Pod, make_pod
+    from .repo import Repo
+
+pod_factory = make_pod  # Placeholder kept by reference before its registration, it is not rebound
+
+
+@register
+class Deployment:
+
+    def __init__(self, name: str, replicas: int = 3):
+        self.name = name
+        self.pods = [make_pod(f"{name}-pod-{i}", deployment=self) for i in range(replicas)]
+
+    @property
+    def ports(self):
+        return [POD_PORT for _ in self.pods]
+
+    def standalone_pod(self):
+        return Pod(f"{self.name}-standalone")
+
+    def repo(self):
+        return Repo[Pod](self.pods)
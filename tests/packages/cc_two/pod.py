@@ -0,0 +1,22 @@
+# pylint:disable=missing-docstring,too-few-public-methods
+from cyclic_classes import back_ref, register, cyclic_imports, register_value
+
+with cyclic_imports():
+    # pylint:disable=cyclic-import
+    from .deployment import Deployment
+
+POD_PORT = register_value("POD_PORT", 8080)
+
+
+@register
+class Pod:
+    deployment = back_ref(Deployment)
+
+    def __init__(self, name: str, deployment: Deployment | None = None):
+        self.name = name
+        self.deployment = deployment
+
+
+@register
+def make_pod(name: str, deployment: Deployment | None = None) -> Pod:
+    return Pod(name, deployment=deployment)
@@ -0,0 +1,19 @@
+# pylint:disable=missing-docstring,too-few-public-methods
+from typing import Generic, TypeVar, ParamSpec
+
+from cyclic_classes import register
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+
+@register
+class Repo(Generic[T]):
+
+    def __init__(self, items: list[T]):
+        self.items = items
+
+
+@register
+class Callback(Generic[P]):
+    pass
@@ -2,6 +2,22 @@
 Base cyclic classes unit tests
 """
 
+import gc
+import sys
+import types
+import asyncio
+import importlib
+import threading
+from typing import get_args, get_origin
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cyclic_classes import back_ref, register, register_value
+from cyclic_classes.classes import get_registered_class
+from cyclic_classes.scheduler import prewarm, unresolved_placeholders
+from cyclic_classes.exceptions import CyclicBackRefError, CyclicRegisteredClassError
+
 
 def test_cc_one():
     """
@@ -28,3 +44,172 @@ def test_cc_one():
     assert isinstance(main.sma.main, cc_one.Main)
     assert isinstance(main.asma.main, cc_one.Main)
     assert isinstance(main.cc_mm.main, cc_one.Main)
+
+
+def test_cc_two_back_ref():
+    """
+    Check if back-references do not keep the parent alive
+    """
+    import cc_two  # pylint:disable=import-outside-toplevel
+
+    deployment = cc_two.Deployment("web")
+    pods = deployment.pods
+
+    assert all(pod.deployment is deployment for pod in pods)
+    assert cc_two.Pod("standalone").deployment is None
+
+    with pytest.raises(CyclicBackRefError):
+        pods[0].deployment = pods[1]
+
+    gc.disable()
+    try:
+        del deployment
+        assert all(pod.deployment is None for pod in pods)
+
+        # Parent held only by its child is freed right away
+        orphan = cc_two.Pod("orphan", deployment=cc_two.Deployment("tmp", replicas=0))
+        assert orphan.deployment is None
+    finally:
+        gc.enable()
+
+    class Slotted:  # pylint:disable=missing-class-docstring,too-few-public-methods
+        __slots__ = ("name",)
+        parent = back_ref()
+
+    with pytest.raises(CyclicBackRefError):
+        Slotted().parent = pods[0]
+    with pytest.raises(CyclicBackRefError):
+        _ = Slotted().parent
+
+
+def test_cc_two_functions_and_values():
+    """
+    Check if registered functions and values replace their placeholders
+    """
+    import cc_two  # pylint:disable=import-outside-toplevel
+    from cc_two import pod, deployment  # pylint:disable=import-outside-toplevel
+
+    # Placeholders imported by cyclic_imports before the registration are rebound to the actual objects
+    assert deployment.make_pod is pod.make_pod
+    assert deployment.POD_PORT == 8080
+    assert cc_two.Deployment("db", replicas=2).ports == [8080, 8080]
+    assert isinstance(cc_two.Deployment("db").standalone_pod(), cc_two.Pod)
+
+    # Placeholder kept by reference still forwards the calls
+    assert deployment.pod_factory is not pod.make_pod
+    assert isinstance(deployment.pod_factory("forwarded"), cc_two.Pod)
+
+    # Names cannot be registered twice, neither over a function/value nor over a registered class
+    with pytest.raises(CyclicRegisteredClassError):
+        register(pod.make_pod)
+    with pytest.raises(CyclicRegisteredClassError):
+        register_value("POD_PORT", 8081, module="cc_two.pod")
+
+    register_value("Alias", cc_two.Pod, module="cc_two.aliases")
+    with pytest.raises(CyclicRegisteredClassError):
+        register_value("Alias", cc_two.Pod, module="cc_two.aliases")
+    assert isinstance(cc_two.Pod("after-alias"), cc_two.Pod)
+
+    # Neither can a class be registered over a function/value
+    for name in ("make_pod", "POD_PORT"):
+        with pytest.raises(CyclicRegisteredClassError):
+            register(type(name, (), {"__module__": "cc_two.pod"}))
+
+
+def test_cc_two_generics():
+    """
+    Check if subscripting placeholders resolves to cached aliases of the registered generic class
+    """
+    import cc_two  # pylint:disable=import-outside-toplevel
+    from cc_two import repo as repo_module  # pylint:disable=import-outside-toplevel
+    from cc_two import deployment  # pylint:disable=import-outside-toplevel
+
+    alias = deployment.Repo[deployment.Pod]
+    assert alias is deployment.Repo[deployment.Pod]
+    assert get_origin(alias) is cc_two.Repo
+    assert get_args(alias) == (deployment.Pod,)
+
+    repo = cc_two.Deployment("api").repo()
+    assert isinstance(repo, cc_two.Repo)
+    assert len(repo.items) == 3
+
+    # Errors of the registered class are not masked
+    with pytest.raises(TypeError):
+        deployment.Repo[int, str]  # pylint:disable=pointless-statement
+    with pytest.raises(TypeError, match="not subscriptable"):
+        deployment.Pod[int]  # pylint:disable=pointless-statement
+
+    # Unhashable parameters resolve to the registered class as well
+    callback = get_registered_class(name="cc_two.repo.Callback", qualname="Callback")
+    assert get_origin(callback[[int, str]]) is repo_module.Callback
+    assert get_args(callback[[int, str]]) == ((int, str),)
+
+    # Placeholder which is not registered yet aliases itself
+    later = get_registered_class(name="cc_two.later.Later", qualname="Later")
+    assert isinstance(later[int], types.GenericAlias)
+    assert get_origin(later[int]) is later
+    assert get_args(later[int]) == (int,)
+
+
+def test_cc_three_prewarm():
+    """
+    Check if prewarm imports defining modules of unresolved placeholders in dependency order
+
+    Team imports User (via cyclic_imports), so user module goes first even though it sorts after team by name
+    """
+    import cc_three  # pylint:disable=import-outside-toplevel
+
+    assert "cc_three.models.user" not in sys.modules
+    assert "cc_three.models.user.User" in unresolved_placeholders()
+
+    assert "cc_three.models.team.Team" in unresolved_placeholders()
+
+    progress = []
+
+    async def run():
+        future = prewarm(priority=["cc_three"], progress=lambda *args: progress.append(args))
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout=5)
+
+    report = asyncio.run(run())
+
+    assert [result.module for result in report.results[:2]] == ["cc_three.models.user", "cc_three.models.team"]
+    assert all(result.error is None for result in report.results[:2])
+    assert "cc_three.models.user.User" not in report.unresolved
+    assert "cc_three.models.team.Team" not in report.unresolved
+    assert progress[0] == (report.results[0], 1, len(report.results))
+    assert cc_three.Api().user("admin").name == "admin"
+    assert [user.name for user in cc_three.Api().team("a", "b").users] == ["a", "b"]
+
+
+def test_prewarm_threads():
+    """
+    Check if placeholders stay consistent while prewarm imports in the background and the main thread imports as well
+    """
+    role = get_registered_class(name="cc_three.models.role.Role", qualname="Role")
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible to provoke races
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            future = prewarm(executor=executor, priority=["cc_three.models.role"])
+            importlib.import_module("cc_three.models.role")  # Concurrently with the prewarm
+
+            for i in range(50):
+                barrier = threading.Barrier(4)
+
+                def race(qualname: str, barrier: threading.Barrier = barrier):
+                    barrier.wait()
+                    return get_registered_class(name=f"{__name__}.{qualname}", qualname=qualname)
+
+                placeholders = list(executor.map(race, [f"Race{i}"] * 4))
+                assert all(placeholder is placeholders[0] for placeholder in placeholders)
+                register_value(f"Race{i}", i, module=__name__)
+
+            report = future.result(timeout=5)
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert report.results[0].module == "cc_three.models.role"
+    assert report.results[0].error is None
+    assert "cc_three.models.role.Role" not in report.unresolved
+    assert isinstance(role(), role)